@@ -1,16 +1,17 @@
 import uuid
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from backend.core.models import User, Program, Module, Task, Resource, TaskType, TaskStatus, ProgramState
-from backend.core.policies import GlobalPolicy
+from backend.core.policies import GlobalPolicy, get_global_policy
+from backend.core.store import program_store
 from backend.agents.prompts import PLANNING_SYSTEM_PROMPT
 from backend.agents.llm import llm_client
 from backend.verification.engine import verifier
 
 class LearningArchitect:
-    def __init__(self, policy: GlobalPolicy):
-        self.policy = policy
+    def __init__(self, policy: Optional[GlobalPolicy] = None):
+        self.policy = policy if policy is not None else get_global_policy()
     
     async def generate_plan(self, user: User) -> Program:
         # 1. Prepare Prompt
@@ -81,4 +82,4 @@ class LearningArchitect:
             active_policies=self.policy.model_dump()
         )
         
-        return program
+        return program_store.save(program)
@@ -0,0 +1,113 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+
+from backend.core.models import Module, Program
+from backend.core.store import program_store
+
+router = APIRouter(prefix="/api/program", tags=["program"])
+
+PROGRAM_FIELDS: Set[str] = set(Program.model_fields)
+MODULE_FIELDS: Set[str] = set(Module.model_fields)
+
+def current_week_number(program: Program, now: Optional[datetime] = None) -> int:
+    """
+    Week of the program the user is in, counted from approval (1-based).
+    Programs that are not approved yet are treated as being in week 1.
+    """
+    if program.approved_at is None:
+        return 1
+    elapsed = (now or datetime.now()) - program.approved_at
+    return max(elapsed.days // 7 + 1, 1)
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    requested = sorted({f.strip() for f in fields.split(",") if f.strip()})
+    unknown = [f for f in requested if f not in PROGRAM_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown program fields: {', '.join(unknown)}")
+    return requested
+
+def parse_week(program: Program, week: Optional[str]) -> Optional[int]:
+    if week is None:
+        return None
+    if week == "current":
+        return current_week_number(program)
+    try:
+        week_number = int(week)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="week must be a positive integer or 'current'")
+    if week_number < 1:
+        raise HTTPException(status_code=400, detail="week must be a positive integer or 'current'")
+    return week_number
+
+def build_include(program: Program, fields: Optional[List[str]], week: Optional[int]) -> Optional[Dict[str, Any]]:
+    """
+    Builds a pydantic include spec for the requested projection.
+    Week pagination keeps only the tasks scheduled for that week, and the
+    modules that contain them (or are themselves scheduled for that week).
+    """
+    if fields is None and week is None:
+        return None
+    include: Dict[str, Any] = {f: True for f in (fields or PROGRAM_FIELDS)}
+    if week is not None and "modules" in include:
+        modules: Dict[int, Any] = {}
+        for i, module in enumerate(program.modules):
+            task_indexes = [j for j, t in enumerate(module.tasks) if t.week_number == week]
+            if module.week_number != week and not task_indexes:
+                continue
+            module_include: Dict[str, Any] = {f: True for f in MODULE_FIELDS}
+            module_include["tasks"] = {j: True for j in task_indexes}
+            modules[i] = module_include
+        include["modules"] = modules
+    return include
+
+def compute_etag(program: Program, fields: Optional[List[str]], week: Optional[int]) -> str:
+    """
+    Weak ETag for a program representation.
+    Derived from the program version (updated_at) plus the projection, so
+    each projected view is cached independently.
+    """
+    key = f"{program.id}:{program.updated_at.isoformat()}:{','.join(fields or [])}:{week or ''}"
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): ignore the W/ prefix on both sides
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+@router.get("/current")
+async def get_current_program(
+    user_id: str = Query(...),
+    fields: Optional[str] = Query(None, description="Comma-separated top-level Program fields to return"),
+    week: Optional[str] = Query(None, description="Only return modules for this week number, or 'current'"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Returns the user's current program.
+    Supports If-None-Match (304 when unchanged), field projection and per-week pagination.
+    """
+    program = program_store.get_current(user_id)
+    if program is None:
+        raise HTTPException(status_code=404, detail="No current program")
+
+    requested_fields = parse_fields(fields)
+    week_number = parse_week(program, week)
+    if week_number is not None and requested_fields is not None and "modules" not in requested_fields:
+        raise HTTPException(status_code=400, detail="week requires 'modules' in fields")
+    etag = compute_etag(program, requested_fields, week_number)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    # Serialize straight to JSON bytes via pydantic-core, skipping FastAPI's jsonable_encoder pass
+    body = program.model_dump_json(include=build_include(program, requested_fields, week_number))
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,3 +1,6 @@
+import json
+import os
+from functools import lru_cache
 from typing import List, Optional, Dict
 from pydantic import BaseModel, Field
 from datetime import time
@@ -62,3 +65,15 @@ class GlobalPolicy(BaseModel):
     channel: ChannelPolicy = Field(default_factory=ChannelPolicy)
     verification: VerificationPolicy = Field(default_factory=VerificationPolicy)
     safety: ContentSafetyPolicy = Field(default_factory=ContentSafetyPolicy)
+
+@lru_cache(maxsize=None)
+def get_global_policy() -> GlobalPolicy:
+    """
+    Returns the process-wide policy snapshot.
+    Loaded once from POLICY_SNAPSHOT_PATH (JSON) if set and present, otherwise defaults.
+    """
+    path = os.getenv("POLICY_SNAPSHOT_PATH")
+    if not path or not os.path.exists(path):
+        return GlobalPolicy()
+    with open(path) as f:
+        return GlobalPolicy.model_validate(json.load(f))
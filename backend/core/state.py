@@ -3,6 +3,7 @@ from datetime import datetime
 import logging
 
 from backend.core.models import Program, ProgramState, User
+from backend.core.store import program_store
 
 logger = logging.getLogger(__name__)
 
@@ -62,9 +63,9 @@ class ProgramStateMachine:
         if new_state == ProgramState.APPROVED:
              self.program.approved_at = datetime.now()
 
-        # Update State
+        # Update State (saving bumps updated_at, which invalidates program ETags)
         self.program.state = new_state
-        self.program.updated_at = datetime.now()
+        program_store.save(self.program)
         
         # Post-transition logic (Side Effects triggers)
         await self._on_transition(current_state, new_state)
@@ -0,0 +1,38 @@
+from typing import Dict, Optional
+from datetime import datetime
+import logging
+
+from backend.core.models import Program
+
+logger = logging.getLogger(__name__)
+
+class ProgramStore:
+    """
+    Holds the current Program per user.
+    Simple in-memory store for MVP. In production, back this with the database.
+
+    The store is per process: under the prefork launcher each worker would
+    hold different programs, so run a single worker (API_WORKERS=1) until
+    this is database-backed.
+    """
+
+    def __init__(self):
+        # Key: user_id, Value: Program
+        self._programs: Dict[str, Program] = {}
+
+    def save(self, program: Program, touch: bool = True) -> Program:
+        """
+        Stores a program as the user's current program.
+        Bumps updated_at so conditional reads see the change.
+        """
+        if touch:
+            program.updated_at = datetime.now()
+        self._programs[program.user_id] = program
+        logger.debug(f"Stored Program {program.id} for user {program.user_id}")
+        return program
+
+    def get_current(self, user_id: str) -> Optional[Program]:
+        return self._programs.get(user_id)
+
+# Global singleton or dependency injection candidate
+program_store = ProgramStore()
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+from backend.core.policies import get_global_policy
+
+# Reuse the server's logger so reports show up under both uvicorn and gunicorn
+logger = logging.getLogger("uvicorn.error")
+
+# Set in each prefork worker by the launcher's post_fork hook
+_forked_at: Optional[float] = None
+
+def warm_shared_state() -> Dict[str, float]:
+    """
+    Loads read-mostly state once, before workers are forked.
+    Workers then share these pages copy-on-write instead of rebuilding them.
+    """
+    stats: Dict[str, float] = {}
+
+    started = time.monotonic()
+    get_global_policy()
+    stats["policy_load_s"] = round(time.monotonic() - started, 4)
+
+    # Imported here, after timing the policy load: building the verifier
+    # reads the policy, so importing it earlier would hide that cost.
+    from backend.verification.engine import verifier
+
+    started = time.monotonic()
+    cache_path = os.getenv("VERIFICATION_CACHE_PATH")
+    if cache_path and os.path.exists(cache_path):
+        try:
+            stats["verification_cache_entries"] = verifier.load_cache(cache_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable verification cache {cache_path}, starting cold: {e}")
+    stats["verification_cache_load_s"] = round(time.monotonic() - started, 4)
+    return stats
+
+def save_shared_state() -> None:
+    """
+    Writes this process's verification cache back to VERIFICATION_CACHE_PATH,
+    so the next master start warms from it.
+    """
+    cache_path = os.getenv("VERIFICATION_CACHE_PATH")
+    if not cache_path:
+        return
+    from backend.verification.engine import verifier
+    try:
+        verifier.dump_cache(cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write verification cache {cache_path}: {e}")
+
+def mark_forked() -> None:
+    global _forked_at
+    _forked_at = time.monotonic()
+
+def process_memory_kb() -> Dict[str, int]:
+    """
+    Memory of the calling process in kB, read from /proc (Linux only).
+    Pss splits shared pages across the processes using them, so the sum of
+    worker Pss is the real footprint; Rss counts shared pages in every worker.
+    """
+    memory: Dict[str, int] = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty"):
+                    memory[key] = int(value.split()[0])
+    except OSError:
+        pass
+    return memory
+
+def log_process_memory(event: str) -> None:
+    memory = process_memory_kb()
+    startup = ""
+    if event == "startup" and _forked_at is not None:
+        startup = f" ready {time.monotonic() - _forked_at:.2f}s after fork"
+    logger.info(
+        f"Worker {os.getpid()} {event}{startup}: "
+        f"rss_kb={memory.get('Rss')} pss_kb={memory.get('Pss')} "
+        f"shared_kb={memory.get('Shared_Clean', 0) + memory.get('Shared_Dirty', 0)} "
+        f"private_kb={memory.get('Private_Clean', 0) + memory.get('Private_Dirty', 0)}"
+    )
+
+async def report_memory_periodically(interval_s: float) -> None:
+    """
+    Logs process memory every interval_s seconds, so copy-on-write sharing
+    can be measured after workers have served real traffic.
+    """
+    while True:
+        await asyncio.sleep(interval_s)
+        log_process_memory("periodic")
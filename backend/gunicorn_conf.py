@@ -0,0 +1,42 @@
+"""
+Production launcher config.
+
+    gunicorn -c backend/gunicorn_conf.py backend.main:app
+
+The app and shared state are loaded once in the master (preload_app), then
+workers are forked and share those pages copy-on-write. Each worker writes
+its verification cache back to VERIFICATION_CACHE_PATH on shutdown (see the
+app lifespan), so the next start forks from a warm cache.
+"""
+import gc
+import logging
+import os
+import time
+
+from backend.core.warmup import mark_forked, process_memory_kb, warm_shared_state
+
+logger = logging.getLogger("gunicorn.error")
+
+_master_started = time.monotonic()
+
+# Keep the collector from running in the master so the objects loaded before
+# fork are not moved around; workers re-enable it after fork.
+gc.disable()
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+workers = int(os.getenv("API_WORKERS", "1"))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+def when_ready(server):
+    stats = warm_shared_state()
+    # Move everything loaded so far into the permanent generation so the
+    # collector in each worker never touches (and dirties) these pages.
+    gc.freeze()
+    stats["frozen_objects"] = gc.get_freeze_count()
+    memory = process_memory_kb()
+    logger.info(f"Master ready in {time.monotonic() - _master_started:.2f}s: {stats}, rss_kb={memory.get('Rss')}")
+
+def post_fork(server, worker):
+    mark_forked()
+    gc.enable()
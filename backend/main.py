@@ -1,10 +1,31 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.api.program import router as program_router
+from backend.core.warmup import log_process_memory, report_memory_periodically, save_shared_state
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Memory is reported after app startup, periodically and at shutdown,
+    # so per-worker copy-on-write sharing can be measured under real load.
+    log_process_memory("startup")
+    interval_s = float(os.getenv("MEMORY_REPORT_INTERVAL_S", "300"))
+    reporter = asyncio.create_task(report_memory_periodically(interval_s)) if interval_s > 0 else None
+    yield
+    if reporter:
+        reporter.cancel()
+    save_shared_state()
+    log_process_memory("shutdown")
+
 app = FastAPI(
     title="MentorOS API",
     description="Goal-first Personal Learning + Coaching Agent API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -13,8 +34,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+app.include_router(program_router)
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "service": "MentorOS Core API"}
@@ -1,10 +1,13 @@
 import httpx
 import asyncio
+import json
+import os
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 import logging
 
 from backend.core.models import VerificationStatus, Resource
+from backend.core.policies import get_global_policy
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,59 @@ class VerificationEngine:
         # Key: URL string, Value: (VerificationStatus, timestamp)
         self._cache: Dict[str, tuple[VerificationStatus, datetime]] = {}
 
+    @staticmethod
+    def _read_snapshot(path: str) -> Dict[str, tuple[VerificationStatus, datetime]]:
+        """
+        Parses a snapshot written by dump_cache.
+        Raises OSError/ValueError if the file is unreadable; malformed entries are skipped.
+        """
+        with open(path) as f:
+            snapshot = json.load(f)
+        if not isinstance(snapshot, dict):
+            raise ValueError(f"Verification cache snapshot {path} is not a JSON object")
+        entries: Dict[str, tuple[VerificationStatus, datetime]] = {}
+        for url, entry in snapshot.items():
+            try:
+                status, timestamp = entry
+                entries[url] = (VerificationStatus(status), datetime.fromisoformat(timestamp))
+            except (TypeError, ValueError):
+                logger.warning(f"Skipping bad verification cache entry for {url}: {entry!r}")
+        return entries
+
+    def load_cache(self, path: str) -> int:
+        """
+        Loads a cache snapshot written by dump_cache.
+        Expired and malformed entries are dropped. Returns the number of entries loaded.
+        """
+        now = datetime.now()
+        ttl = timedelta(days=self.verification_ttl_days)
+        loaded = 0
+        for url, (status, checked_at) in self._read_snapshot(path).items():
+            if now - checked_at < ttl:
+                self._cache[url] = (status, checked_at)
+                loaded += 1
+        logger.info(f"Loaded {loaded} verification cache entries from {path}")
+        return loaded
+
+    def dump_cache(self, path: str) -> None:
+        """
+        Writes the cache to a JSON snapshot that load_cache can read back.
+        Merges with an existing snapshot (newest check wins) so several workers
+        can dump to the same path, and replaces the file atomically.
+        """
+        try:
+            merged = self._read_snapshot(path)
+        except (OSError, ValueError):
+            merged = {}
+        for url, (status, checked_at) in self._cache.items():
+            if url not in merged or merged[url][1] < checked_at:
+                merged[url] = (status, checked_at)
+        snapshot = {url: (status.value, ts.isoformat()) for url, (status, ts) in merged.items()}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+
     async def verify_url(self, url: str) -> VerificationStatus:
         """
         Verifies a URL exists and is reachable.
@@ -83,4 +139,6 @@ class VerificationEngine:
         return await asyncio.gather(*tasks)
 
 # Global singleton or dependency injection candidate
-verifier = VerificationEngine()
+verifier = VerificationEngine(
+    verification_ttl_days=get_global_policy().verification.verification_ttl_days
+)
@@ -0,0 +1,89 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.program import etag_matches
+from backend.core.models import Module, Program, Task, TaskType
+from backend.core.store import program_store
+from backend.main import app
+
+client = TestClient(app)
+
+def make_task(task_id: str, week_number: int) -> Task:
+    return Task(id=task_id, week_number=week_number, title=task_id, type=TaskType.READING, estimated_minutes=30)
+
+@pytest.fixture
+def program() -> Program:
+    # Approved 8 days ago, so the current week is week 2
+    program = Program(
+        id=str(uuid.uuid4()),
+        user_id=str(uuid.uuid4()),
+        title="Python Mastery",
+        approved_at=datetime.now() - timedelta(days=8),
+        modules=[
+            Module(id="m1", week_number=1, title="Basics", tasks=[make_task("t1", 1), make_task("t2", 2)]),
+            Module(id="m3", week_number=3, title="Project", tasks=[make_task("t3", 3)]),
+        ],
+    )
+    return program_store.save(program)
+
+def get_current(program: Program, headers=None, **params):
+    return client.get("/api/program/current", params={"user_id": program.user_id, **params}, headers=headers)
+
+def test_returns_304_until_program_changes(program):
+    first = get_current(program)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = get_current(program, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    program_store.save(program)
+    changed = get_current(program, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+def test_projection_changes_etag(program):
+    full = get_current(program)
+    projected = get_current(program, fields="state,id")
+    assert projected.status_code == 200
+    assert projected.json() == {"id": program.id, "state": "START"}
+    assert projected.headers["ETag"] != full.headers["ETag"]
+
+def test_current_week_returns_only_that_weeks_tasks(program):
+    response = get_current(program, fields="modules", week="current")
+    assert response.status_code == 200
+    modules = response.json()["modules"]
+    assert [m["id"] for m in modules] == ["m1"]
+    assert [t["id"] for t in modules[0]["tasks"]] == ["t2"]
+
+def test_week_without_matching_modules_is_empty(program):
+    response = get_current(program, week="4")
+    assert response.json()["modules"] == []
+
+@pytest.mark.parametrize("params", [
+    {"fields": "id,nope"},
+    {"week": "0"},
+    {"week": "next"},
+    {"fields": "id", "week": "1"},
+])
+def test_rejects_bad_params(program, params):
+    assert get_current(program, **params).status_code == 400
+
+def test_unknown_user_is_404():
+    assert client.get("/api/program/current", params={"user_id": "missing"}).status_code == 404
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    (None, False),
+    ("*", True),
+    ('W/"abc"', True),
+    ('"abc"', True),
+    ('"xyz", W/"abc"', True),
+    ('"xyz"', False),
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, 'W/"abc"') is expected
@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.core.models import VerificationStatus
+from backend.verification.engine import VerificationEngine
+
+def test_dump_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "cache.json")
+    engine = VerificationEngine()
+    engine._cache["https://a"] = (VerificationStatus.VERIFIED, datetime.now())
+    engine.dump_cache(path)
+
+    loaded = VerificationEngine()
+    assert loaded.load_cache(path) == 1
+    assert loaded._cache["https://a"][0] == VerificationStatus.VERIFIED
+
+def test_load_skips_bad_and_expired_entries(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps({
+        "https://ok": ["VERIFIED", datetime.now().isoformat()],
+        "https://old": ["VERIFIED", (datetime.now() - timedelta(days=30)).isoformat()],
+        "https://bogus": ["BOGUS", datetime.now().isoformat()],
+        "https://bad-time": ["FAILED", "yesterday"],
+        "https://not-a-pair": 5,
+    }))
+    engine = VerificationEngine()
+    assert engine.load_cache(str(path)) == 1
+    assert list(engine._cache) == ["https://ok"]
+
+def test_load_rejects_unparseable_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{truncated")
+    with pytest.raises(ValueError):
+        VerificationEngine().load_cache(str(path))
+
+def test_dump_merges_keeping_newest_check(tmp_path):
+    path = str(tmp_path / "cache.json")
+    stale = VerificationEngine()
+    stale._cache["https://a"] = (VerificationStatus.FAILED, datetime.now() - timedelta(days=1))
+    fresh = VerificationEngine()
+    fresh._cache["https://a"] = (VerificationStatus.VERIFIED, datetime.now())
+    fresh._cache["https://b"] = (VerificationStatus.VERIFIED, datetime.now())
+
+    fresh.dump_cache(path)
+    stale.dump_cache(path)
+
+    merged = VerificationEngine()
+    assert merged.load_cache(path) == 2
+    assert merged._cache["https://a"][0] == VerificationStatus.VERIFIED
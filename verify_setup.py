@@ -4,7 +4,7 @@ from datetime import datetime
 
 # Import backend components
 from backend.core.models import User, UserProfile, ChannelType, ProgramState
-from backend.core.policies import GlobalPolicy
+from backend.core.policies import get_global_policy
 from backend.agents.planner import LearningArchitect
 from backend.core.state import ProgramStateMachine
 from backend.verification.engine import verifier
@@ -28,8 +28,8 @@ async def run_verification():
     print(f"[User] Created: {user.name} ({user.id})")
 
     # 2. Setup Policy
-    policy = GlobalPolicy()
-    print("[Policy] Initialized default policies.")
+    policy = get_global_policy()
+    print("[Policy] Loaded global policy snapshot.")
 
     # 3. Generate Plan (Planning Agent)
     print("[Agent] Generating plan (mock LLM)...")